@@ -25,7 +25,7 @@ from typing import List, Optional
 
 
 from game import simulate_rounds
-from strategies import STRATEGIES
+from strategies import DETERMINISTIC_STRATEGIES, STRATEGIES
 from schemas import HandRecord
 
 
@@ -86,5 +86,6 @@ def simulate(req: SimRequest) -> List[HandRecord]:
         strategy_fn=strategy_fn,
         seed=req.seed,
         bet_mode=req.bet_mode,
+        single_path=req.strategy in DETERMINISTIC_STRATEGIES,
     )
-    return [HandRecord(**result.__dict__) for result in results]
\ No newline at end of file
+    return [HandRecord.model_validate(result) for result in results]
\ No newline at end of file
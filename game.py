@@ -13,8 +13,10 @@ It updates the running Hi‑Lo count after each round and provides the true
 count used to adjust bets for subsequent rounds.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, List, Optional, Tuple
+import copy
+import itertools
 import random
 
 
@@ -38,59 +40,129 @@ VALUES = {
 }
 
 
+# Hi‑Lo count value per rank: low cards +1, neutral 0, tens and Aces −1.
+HI_LO_VALUES = {
+    "A": -1,
+    "2": 1,
+    "3": 1,
+    "4": 1,
+    "5": 1,
+    "6": 1,
+    "7": 0,
+    "8": 0,
+    "9": 0,
+    "10": -1,
+    "J": -1,
+    "Q": -1,
+    "K": -1,
+}
+
+
 def hi_lo_value(rank: str) -> int:
     """Return the Hi‑Lo count value for a given rank."""
-    if rank in ("2", "3", "4", "5", "6"):
-        return 1
-    if rank in ("7", "8", "9"):
-        return 0
-    return -1  # 10, J, Q, K, A
+    return HI_LO_VALUES[rank]
+
+
+# Internally the shoe deals rank codes (indices into RANKS) so that card
+# values and Hi‑Lo weights are tuple lookups instead of string hashing.
+# Ranks are turned back into strings as cards land in a HandState.
+RANK_CODES = {rank: code for code, rank in enumerate(RANKS)}
+ACE = RANK_CODES["A"]
+VALUE_ARR: Tuple[int, ...] = tuple(VALUES[r] for r in RANKS)
+HILO_ARR: Tuple[int, ...] = tuple(HI_LO_VALUES[r] for r in RANKS)
+
+# One deck in rank blocks (four copies of each rank); a shoe is this
+# template repeated ``num_decks`` times and then shuffled.
+_DECK_TEMPLATE: List[int] = [code for code in range(len(RANKS)) for _ in range(4)]
+
+# Bits of ``HandState.flags``; only two-card hands have any of them set.
+CAN_DOUBLE = 1
+PAIR = 2
+BLACKJACK = 4
 
 
 class Shoe:
     """
     A shoe containing multiple decks of 52 cards, but only storing card
-    ranks (suits are omitted).  Each rank appears four times per deck.
-
-    The shoe reshuffles automatically when 75%% of its cards have been
-    dealt (i.e. when only 25%% remain), resetting the running Hi‑Lo count.
+    ranks (suits are omitted) as rank codes, i.e. indices into ``RANKS``.
+    Each rank appears four times per deck.
+
+    Cards are never removed from the underlying list: a cursor (``_pos``)
+    counts down from the end of the shuffled shoe, so dealing a card is a
+    single index operation and ``cards_remaining`` is just the cursor.
+    The list is never mutated once shuffled (``reshuffle`` builds a new
+    one), which lets ``clone_shoe`` share it between shoes.
     """
 
-    def __init__(self, num_decks: int = 6, shuffle_seed: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        num_decks: int = 6,
+        shuffle_seed: Optional[int] = None,
+        reshuffle_when_empty: bool = False,
+    ) -> None:
         self.num_decks = num_decks
+        self.reshuffle_when_empty = reshuffle_when_empty
+        self.shuffles = 0
         self._rng = random.Random(shuffle_seed)
         self._cards_total = 0
-        self._shoe: List[str] = []
+        self._shoe: List[int] = []
+        self._pos = 0
         self.reshuffle()
 
     def reshuffle(self) -> None:
         """Reshuffle the shoe by loading all decks and randomising the order."""
-        self._shoe = []
-        for _ in range(self.num_decks):
-            for rank in RANKS:
-                # 4 copies per rank per deck
-                self._shoe.extend([rank] * 4)
+        self._shoe = _DECK_TEMPLATE * self.num_decks
         self._rng.shuffle(self._shoe)
         self._cards_total = len(self._shoe)
+        self._pos = self._cards_total
+        self.shuffles += 1
 
     def cards_remaining(self) -> int:
-        return len(self._shoe)
+        return self._pos
 
     def decks_remaining(self) -> float:
-        return max(0.0001, len(self._shoe) / 52.0)
+        """Decks left to deal.  Callers reshuffle an empty shoe before dividing by this."""
+        return self._pos / 52.0
 
-    def pop(self) -> str:
+    def pop(self) -> int:
         """
-        Pop one card rank from the shoe.  If fewer than 25%% of cards remain,
-        the shoe is automatically reshuffled.
-        
-        if len(self._shoe) <= 0.25 * self._cards_total:
-            self.reshuffle()
+        Deal one card (as a rank code) from the shoe.  Reshuffling between
+        rounds is left to the caller (see ``simulate_rounds``); an empty shoe
+        is reshuffled only if ``reshuffle_when_empty`` is set.
         """
-        return self._shoe.pop()
-
+        if self._pos <= 0:
+            if not self.reshuffle_when_empty:
+                raise IndexError("pop from empty shoe")
+            self.reshuffle()
+        self._pos -= 1
+        return self._shoe[self._pos]
 
-@dataclass
+    def rewind(self, pos: int) -> None:
+        """
+        Move the cursor back to ``pos`` (an earlier ``cards_remaining()``),
+        returning every card dealt since then to the shoe in order.
+        """
+        self._pos = pos
+
+    def dealt_since_shuffle(self) -> List[int]:
+        """Rank codes dealt since the last reshuffle (most recent first)."""
+        return self._shoe[self._pos:]
+
+    def draw_many(self, n: int) -> List[int]:
+        """Deal ``n`` cards at once, in the same order ``n`` pops would."""
+        if n > self._pos:
+            if not self.reshuffle_when_empty:
+                raise IndexError("not enough cards in shoe")
+            # drains the shoe and reshuffles mid-draw, exactly like n pops
+            return [self.pop() for _ in range(n)]
+        start = self._pos - n
+        cards = self._shoe[start:self._pos]
+        cards.reverse()
+        self._pos = start
+        return cards
+
+
+@dataclass(slots=True)
 class HandState:
     """Represents a player's or dealer's hand and the associated bet."""
 
@@ -98,40 +170,82 @@ class HandState:
     bet: float
     actions: List[str]
     doubled: bool = False
+    # Running Blackjack total and the number of Aces still counted as 11.
+    # Kept up to date by ``add_card`` so ``value`` never re-walks the cards.
+    _total: int = field(default=0, init=False, repr=False, compare=False)
+    _soft_aces: int = field(default=0, init=False, repr=False, compare=False)
+    # CAN_DOUBLE | PAIR | BLACKJACK bits, refreshed by ``add_card``.
+    flags: int = field(default=0, init=False, repr=False, compare=False)
+    # Hi‑Lo count of the cards in this hand.
+    hilo_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        cards = self.cards
+        self.cards = []
+        for r in cards:
+            self.add_card(RANK_CODES[r])
+
+    def add_card(self, code: int) -> None:
+        """
+        Append a card, given as a rank code, to the hand, counting Aces as
+        11 and demoting them to 1 as needed to avoid busting.
+        """
+        rank = RANKS[code]
+        self.cards.append(rank)
+        self._total += VALUE_ARR[code]
+        self.hilo_count += HILO_ARR[code]
+        if code == ACE:
+            self._soft_aces += 1
+        while self._total > 21 and self._soft_aces:
+            self._total -= 10
+            self._soft_aces -= 1
+        if len(self.cards) == 2:
+            flags = CAN_DOUBLE
+            if self.cards[0] == rank:
+                flags |= PAIR
+            if self._total == 21:
+                flags |= BLACKJACK
+            self.flags = flags
+        else:
+            self.flags = 0
+
+    def copy(self) -> "HandState":
+        """Return an independent copy, reusing the cached total."""
+        h = HandState(cards=[], bet=self.bet, actions=list(self.actions), doubled=self.doubled)
+        h.cards = list(self.cards)
+        h._total = self._total
+        h._soft_aces = self._soft_aces
+        h.flags = self.flags
+        h.hilo_count = self.hilo_count
+        return h
 
     @property
     def value(self) -> int:
-        """
-        Compute the Blackjack value of the hand, counting Aces as 1 or 11
-        to avoid busting where possible.
-        """
-        total = 0
-        aces = 0
-        for r in self.cards:
-            if r == "A":
-                total += 11
-                aces += 1
-            else:
-                total += VALUES[r]
-        while total > 21 and aces > 0:
-            total -= 10
-            aces -= 1
-        return total
+        """The Blackjack value of the hand."""
+        return self._total
+
+    @property
+    def is_soft(self) -> bool:
+        """Whether the hand holds an Ace currently counted as 11."""
+        return self._soft_aces > 0
 
     def is_blackjack(self) -> bool:
-        return len(self.cards) == 2 and self.value == 21
+        return bool(self.flags & BLACKJACK)
 
     def can_split(self) -> bool:
-        return len(self.cards) == 2 and self.cards[0] == self.cards[1]
+        return bool(self.flags & PAIR)
 
     def can_double(self) -> bool:
-        return len(self.cards) == 2
+        return bool(self.flags & CAN_DOUBLE)
 
 
 StrategyFn = Callable[[HandState, str], str]
 
+# Most hands a player may hold in one round after splitting.
+MAX_HANDS = 4
 
-@dataclass
+
+@dataclass(slots=True)
 class RoundResult:
     """
     Represents the outcome of a single hand (possibly one of several from
@@ -140,9 +254,9 @@ class RoundResult:
 
     round_id: int
     hand_number: int
-    player_cards: List[str]
-    dealer_cards: List[str]
-    actions: List[str]
+    player_cards: Tuple[str, ...]
+    dealer_cards: Tuple[str, ...]
+    actions: Tuple[str, ...]
     bet_amount: float
     final_result: str  # "win" | "lose" | "push"
     blackjack: bool
@@ -159,7 +273,7 @@ class RoundResult:
 def _dealer_play(dealer: HandState, shoe: Shoe) -> None:
     """Dealer hits until reaching 17 or higher."""
     while dealer.value < 17:
-        dealer.cards.append(shoe.pop())
+        dealer.add_card(shoe.pop())
         dealer.actions.append("hit")
     dealer.actions.append("stand")
 
@@ -193,9 +307,13 @@ def _bet_from_true_count(tc: float, base: float = 10.0, max_mult: int = 5) -> fl
         mult = max_mult
     return float(base * mult)
 
+# Todos los órdenes posibles de recorrer 2 o 3 acciones legales, para
+# elegir uno con una sola llamada al RNG en vez de barajar en cada nodo.
+_ACTION_ORDERS = {n: tuple(itertools.permutations(range(n))) for n in (2, 3)}
+
 def legal_actions(hand: HandState) -> List[str]:
     acts = ["stand", "hit"]
-    if hand.can_double():
+    if hand.flags & CAN_DOUBLE:
         acts.append("double")
     # Si querés incluir split en esta v1, descomentá:
     # if hand.can_split():
@@ -204,11 +322,10 @@ def legal_actions(hand: HandState) -> List[str]:
 
 def clone_shoe(src: Shoe) -> Shoe:
     """Clona el shoe actual (mismo contenido de cartas)."""
-    dst = Shoe(num_decks=src.num_decks)     # crea base
-    dst._shoe = list(src._shoe)             # copia estado
-    dst._cards_total = src._cards_total
-    # RNG distinto por rama = orden distinto de draws (bien para Monte Carlo)
-    dst._rng = random.Random()              # si querés reproducibilidad, seteá una seed externa
+    # copia superficial, sin __init__ (no baraja): comparte la lista de cartas,
+    # que no se modifica tras barajar, y el RNG, porque las ramas no rebarajan
+    dst = copy.copy(src)
+    dst.reshuffle_when_empty = False        # rebobinar no sirve si la rama rebaraja
     return dst
 
 def apply_action_once(hand: HandState, action: str, shoe: Shoe) -> Tuple[HandState, bool]:
@@ -216,19 +333,19 @@ def apply_action_once(hand: HandState, action: str, shoe: Shoe) -> Tuple[HandSta
     Aplica UNA acción del jugador sobre una copia de la mano y devuelve:
     - (nueva_mano, terminal_del_turno_del_jugador)
     """
-    h = HandState(cards=list(hand.cards), bet=hand.bet, actions=list(hand.actions), doubled=hand.doubled)
+    h = hand.copy()
 
     if action == "hit":
-        h.cards.append(shoe.pop())
+        h.add_card(shoe.pop())
         h.actions.append("hit")
         # si bust, el turno del jugador terminó
         return h, (h.value > 21)
 
-    if action == "double" and h.can_double():
+    if action == "double" and h.flags & CAN_DOUBLE:
         h.bet *= 2.0
         h.doubled = True
         h.actions.append("double")
-        h.cards.append(shoe.pop())
+        h.add_card(shoe.pop())
         h.actions.append("stand")
         return h, True  # double cierra el turno
 
@@ -245,13 +362,21 @@ def dfs_play_all_paths(
     true_count_prev_round: float,
     bet_mode: str,
     results_acc: List[RoundResult],
+    rng: Optional[random.Random] = None,
 ):
     """
     Explora en profundidad TODAS las ramas desde la mano inicial.
     En cada nodo: toma acciones LEGALES, baraja su orden al azar y recurre.
     Cuando el jugador termina (stand/double/bust), juega dealer y registra 1 fila.
+
+    Solo "hit" sin bust sigue profundizando, así que el árbol es una cadena:
+    a lo sumo un "stand" por nivel más el "double" de la raíz, y el bust
+    acota la profundidad (menos de 12 hits).  Las filas por ronda crecen
+    linealmente con los hits, no exponencialmente.
     """
 
+    randrange = rng.randrange if rng is not None else random.randrange
+
     # Estado raíz
     root_player = HandState(cards=list(init_player), bet=base_bet, actions=[])
     root_dealer = HandState(cards=list(init_dealer), bet=0.0, actions=[])
@@ -263,20 +388,19 @@ def dfs_play_all_paths(
         outcome = _settle(player.value, dealer.value)
         final_result = "push" if outcome == 0 else ("win" if outcome > 0 else "lose")
         busted = player.value > 21
-        blackjack = player.is_blackjack()
+        blackjack = bool(player.flags & BLACKJACK)
 
         # Conteo Hi-Lo local de esta rama (cartas vistas)
-        seen = player.cards + dealer.cards
-        local_rc = sum(hi_lo_value(r) for r in seen)
-        local_tc = local_rc / max(0.0001, 52.0 * shoe.num_decks)  # aprox. TC local por rama
+        local_rc = player.hilo_count + dealer.hilo_count
+        local_tc = local_rc / (52.0 * shoe.num_decks)  # aprox. TC local por rama
 
         results_acc.append(
             RoundResult(
                 round_id=round_id,
                 hand_number=1,
-                player_cards=list(player.cards),
-                dealer_cards=list(dealer.cards),
-                actions=list(player.actions),
+                player_cards=tuple(player.cards),
+                dealer_cards=tuple(dealer.cards),
+                actions=tuple(player.actions),
                 bet_amount=player.bet,
                 final_result=final_result,
                 blackjack=blackjack,
@@ -297,42 +421,159 @@ def dfs_play_all_paths(
             _dealer_phase_and_emit(player, dealer, shoe)
             return
 
-        # Acciones legales del nodo actual (orden aleatorio)
+        # Acciones legales del nodo actual, en uno de sus órdenes posibles al azar
         acts = legal_actions(player)
-        random.shuffle(acts)
+        orders = _ACTION_ORDERS[len(acts)]
+        order = orders[randrange(len(orders))]
 
-        for act in acts:
-            # Clonar estado para la rama
-            p = HandState(cards=list(player.cards), bet=player.bet, actions=list(player.actions), doubled=player.doubled)
-            d = HandState(cards=list(dealer.cards), bet=dealer.bet, actions=list(dealer.actions), doubled=dealer.doubled if hasattr(dealer,'doubled') else False)
-            sh = clone_shoe(shoe)
+        # Todas las ramas comparten el shoe: al volver de cada una se
+        # rebobina el cursor y las cartas que robó vuelven al shoe.
+        mark = shoe.cards_remaining()
+        for i in order:
+            act = acts[i]
+            # Clonar estado para la rama (apply_action_once ya copia al jugador)
+            d = dealer.copy()
 
             # Aplicar acción una vez
-            p, player_turn_done = apply_action_once(p, act, sh)
+            p, player_turn_done = apply_action_once(player, act, shoe)
 
             if player_turn_done:
                 # emite fila terminal (dealer juega adentro)
-                _dealer_phase_and_emit(p, d, sh)
+                _dealer_phase_and_emit(p, d, shoe)
             else:
                 # seguir profundizando (más hits posibles)
-                _dfs(p, d, sh)
+                _dfs(p, d, shoe)
+            shoe.rewind(mark)
 
-    # arrancar DFS desde la raíz
+    # arrancar DFS desde la raíz (única copia del shoe por ronda)
     _dfs(root_player, root_dealer, clone_shoe(shoe_for_node))
 
+def play_single_path(
+    init_player: List[int],
+    init_dealer: List[int],
+    shoe: Shoe,
+    strategy_name: str,
+    strategy_fn: StrategyFn,
+    base_bet: float,
+    round_id: int,
+    true_count_prev_round: float,
+    running_count_prev: float,
+    bet_mode: str,
+    results_acc: List[RoundResult],
+) -> float:
+    """
+    Juega UNA ronda siguiendo la estrategia (sin explorar ramas), robando
+    del shoe real, y registra 1 fila por mano del jugador (varias si divide).
+    Devuelve el conteo Hi-Lo acumulado al final de la ronda: el previo más
+    las cartas vistas, o solo las cartas del shoe nuevo si se rebarajó a
+    mitad de ronda.
+
+    Si la estrategia pide "split" con la mano ya en MAX_HANDS manos, se le
+    vuelve a preguntar por la misma mano sin el bit PAIR (como si no fuera
+    divisible); si aun así devuelve "split", la mano se planta.
+    """
+    shuffles = shoe.shuffles
+    player = HandState(cards=[], bet=base_bet, actions=[])
+    dealer = HandState(cards=[], bet=0.0, actions=[])
+    for c in init_player:
+        player.add_card(c)
+    for c in init_dealer:
+        dealer.add_card(c)
+    dealer_up = dealer.cards[0]
+
+    # Manos pendientes como pila LIFO: al dividir se apilan ambas mitades
+    # (la izquierda arriba) y se juegan en orden.
+    todo = [player]
+    finished: List[HandState] = []
+    n_hands = 1
+    while todo:
+        hand = todo.pop()
+        while hand.value <= 21:
+            action = strategy_fn(hand, dealer_up)
+            if action == "split" and hand.flags & PAIR:
+                if n_hands < MAX_HANDS:
+                    n_hands += 1
+                    halves = []
+                    for rank in hand.cards:
+                        half = HandState(cards=[rank], bet=hand.bet, actions=hand.actions + ["split"])
+                        half.add_card(shoe.pop())
+                        halves.append(half)
+                    todo.append(halves[1])
+                    todo.append(halves[0])
+                    hand = None
+                    break
+                # tope de manos: se pide la decisión para la mano como no divisible
+                hand.flags &= ~PAIR
+                action = strategy_fn(hand, dealer_up)
+            if action == "split":
+                action = "stand"
+            hand, player_turn_done = apply_action_once(hand, action, shoe)
+            if player_turn_done:
+                break
+        if hand is not None:
+            finished.append(hand)
+
+    _dealer_play(dealer, shoe)
+    if not shoe.cards_remaining():
+        # shoe agotado justo al final: se rebaraja antes de dividir por los mazos restantes
+        shoe.reshuffle()
+
+    if shoe.shuffles == shuffles:
+        running_count_end = running_count_prev + dealer.hilo_count + sum(h.hilo_count for h in finished)
+    else:
+        # se rebarajó durante la ronda: el conteo arranca con el shoe nuevo
+        running_count_end = sum(HILO_ARR[c] for c in shoe.dealt_since_shuffle())
+    true_count_end = running_count_end / shoe.decks_remaining()
+    for hand_number, hand in enumerate(finished, start=1):
+        outcome = _settle(hand.value, dealer.value)
+        results_acc.append(
+            RoundResult(
+                round_id=round_id,
+                hand_number=hand_number,
+                player_cards=tuple(hand.cards),
+                dealer_cards=tuple(dealer.cards),
+                actions=tuple(hand.actions),
+                bet_amount=hand.bet,
+                final_result="push" if outcome == 0 else ("win" if outcome > 0 else "lose"),
+                blackjack=n_hands == 1 and bool(hand.flags & BLACKJACK),
+                busted=hand.value > 21,
+                strategy_used=strategy_name,
+                bet_mode=bet_mode,
+                true_count_prev_round=round(true_count_prev_round, 3),
+                running_count_end=round(running_count_end, 3),
+                true_count_end=round(true_count_end, 3),
+                cards_remaining=shoe.cards_remaining(),
+                decks_remaining=round(shoe.decks_remaining(), 3),
+            )
+        )
+    return running_count_end
+
 def simulate_rounds(
     rounds: int,
     num_decks: int,
     base_bet: float,
-    strategy_name: str,      # se conserva por compatibilidad (no se usa)
-    strategy_fn: StrategyFn, # se conserva por compatibilidad (no se usa)
+    strategy_name: str,
+    strategy_fn: StrategyFn, # sólo se usa con single_path
     seed: Optional[int] = None,
     bet_mode: str = "fixed", # "fixed" | "hi-lo"
+    single_path: bool = False,
 ) -> List[RoundResult]:
+    """
+    Simula ``rounds`` rondas sobre un mismo shoe.  Con ``single_path`` (para
+    estrategias deterministas, ver ``strategies.DETERMINISTIC_STRATEGIES``)
+    cada ronda juega un único camino con ``play_single_path``; si no, se
+    exploran todas las ramas con ``dfs_play_all_paths``.
+    """
+    # parámetros fijos de la corrida: se resuelven una sola vez, no por ronda
+    hi_lo_bets = bet_mode == "hi-lo"     # apuesta base según bet_mode
+    fixed_bet = float(base_bet)
 
-    rng = random.Random(seed)
+    # RNG propio para el orden de las ramas del DFS: con la misma semilla que
+    # el shoe repetiría los bits ya usados para barajar
+    rng = random.Random(None if seed is None else seed + 1)
     # Shoe solo para REPARTIR la mano inicial de cada round
-    deal_shoe = Shoe(num_decks=num_decks, shuffle_seed=seed)
+    # (una ronda de un solo camino puede agotarlo: en ese caso se rebaraja)
+    deal_shoe = Shoe(num_decks=num_decks, shuffle_seed=seed, reshuffle_when_empty=single_path)
     cards_total = deal_shoe.cards_remaining()
     results: List[RoundResult] = []
     running_count_prev = 0.0
@@ -346,30 +587,44 @@ def simulate_rounds(
             cards_total = deal_shoe.cards_remaining()
             true_count_prev = 0.0
 
-        # apuesta base según bet_mode
-        if bet_mode == "hi-lo":
-            bet_base = _bet_from_true_count(true_count_prev, base=base_bet)
-        else:
-            bet_base = float(base_bet)
+        bet_base = _bet_from_true_count(true_count_prev, base=base_bet) if hi_lo_bets else fixed_bet
 
         # repartir mano inicial (jugador/dealer)
-        init_player = [deal_shoe.pop(), deal_shoe.pop()]
-        init_dealer = [deal_shoe.pop(), deal_shoe.pop()]
+        p1, p2, d1, d2 = deal_shoe.draw_many(4)
+
+        if single_path:
+            # la ronda se juega con el shoe real: cuentan todas las cartas vistas
+            running_count_prev = play_single_path(
+                init_player=[p1, p2],
+                init_dealer=[d1, d2],
+                shoe=deal_shoe,
+                strategy_name=strategy_name,
+                strategy_fn=strategy_fn,
+                base_bet=bet_base,
+                round_id=round_id,
+                true_count_prev_round=true_count_prev,
+                running_count_prev=running_count_prev,
+                bet_mode=bet_mode,
+                results_acc=results,
+            )
+            true_count_prev = running_count_prev / deal_shoe.decks_remaining()
+            continue
 
         # DFS: explora TODAS las ramas, eligiendo orden aleatorio en cada nodo
         dfs_play_all_paths(
-            init_player=init_player,
-            init_dealer=init_dealer,
+            init_player=[RANKS[p1], RANKS[p2]],
+            init_dealer=[RANKS[d1], RANKS[d2]],
             shoe_for_node=deal_shoe,                 # sólo para referenciar decks_remaining/cards_remaining
             base_bet=bet_base,
             round_id=round_id,
             true_count_prev_round=true_count_prev,
             bet_mode=bet_mode,
             results_acc=results,
+            rng=rng,
         )
 
         # avanzar el conteo “global” SOLO con el reparto inicial (coherente con tu idea de TC por ronda)
-        running_count_prev += sum(hi_lo_value(r) for r in (init_player + init_dealer))
+        running_count_prev += HILO_ARR[p1] + HILO_ARR[p2] + HILO_ARR[d1] + HILO_ARR[d2]
         true_count_prev = running_count_prev / deal_shoe.decks_remaining()
 
     return results
\ No newline at end of file
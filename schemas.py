@@ -6,7 +6,7 @@ and ensure that responses are properly validated and serialised by
 FastAPI.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List
 
 
@@ -16,6 +16,9 @@ class HandRecord(BaseModel):
     responses.
     """
 
+    # Built straight from ``game.RoundResult`` instances (see ``app.simulate``).
+    model_config = ConfigDict(from_attributes=True)
+
     round_id: int
     hand_number: int
     player_cards: List[str] = Field(..., description="The ranks of the player's cards in this hand.")
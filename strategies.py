@@ -15,11 +15,14 @@ Strategies included:
   including splitting and doubling rules.
 
 The strategies are exported in the ``STRATEGIES`` dictionary for easy
-lookup.
+lookup; the deterministic ones are also listed in
+``DETERMINISTIC_STRATEGIES``.
 """
 
-from typing import Dict
-from game import HandState, VALUES
+import itertools
+import random
+from typing import Dict, Optional, Tuple
+from game import CAN_DOUBLE, PAIR, RANKS, HandState, VALUES
 
 
 def simplest_strategy(hand: HandState, dealer_up: str) -> str:
@@ -27,26 +30,34 @@ def simplest_strategy(hand: HandState, dealer_up: str) -> str:
     return "hit" if hand.value < 17 else "stand"
 
 
+_HIT_OR_STAND = ("hit", "stand")
+_rng = random.Random()
+
+
 def random_strategy(hand: HandState, dealer_up: str) -> str:
     """Randomly choose between hit and stand."""
-    import random
-    return random.choice(["hit", "stand"])
+    return _HIT_OR_STAND[_rng.getrandbits(1)]
 
 
-def basic_strategy(hand: HandState, dealer_up: str) -> str:
+def _basic_decision(
+    value: int, is_soft: bool, dealer_up: str, can_double: bool, pair_rank: Optional[str]
+) -> str:
     """
     Simplified Basic Strategy covering splits, soft totals, and hard totals.
     Adapted to a single‐deck perspective and to ranks without suits.
 
-    :param hand: The player's current hand state.
+    :param value: The player's hand value.
+    :param is_soft: Whether the hand holds an Ace counted as 11.
     :param dealer_up: Dealer's upcard rank.
+    :param can_double: Whether doubling is allowed on this hand.
+    :param pair_rank: The paired rank if the hand can be split, else None.
     :returns: One of 'hit', 'stand', 'double', or 'split'.
     """
     dealer_val = VALUES[dealer_up]
 
     # Check for split opportunities first
-    if hand.can_split():
-        rank = hand.cards[0]
+    if pair_rank is not None:
+        rank = pair_rank
         # Pairs by rank (using rank strings)
         if rank == "A":
             return "split"
@@ -61,65 +72,88 @@ def basic_strategy(hand: HandState, dealer_up: str) -> str:
         if rank == "6":
             return "split" if 2 <= dealer_val <= 6 else "hit"
         if rank == "5":
-            return "double" if (2 <= dealer_val <= 9 and hand.can_double()) else "hit"
+            return "double" if (2 <= dealer_val <= 9 and can_double) else "hit"
         if rank == "4":
             return "split" if 5 <= dealer_val <= 6 else "hit"
         if rank in ("3", "2"):
             return "split" if 2 <= dealer_val <= 7 else "hit"
 
-    # Determine if the hand is soft (counting an Ace as 11)
-    # A hand is soft if it contains at least one Ace that could be counted as 11
-    total = 0
-    aces = 0
-    for c in hand.cards:
-        if c == "A":
-            total += 11
-            aces += 1
-        else:
-            total += VALUES[c]
-    # reduce soft Aces until total is <=21
-    while total > 21 and aces > 0:
-        total -= 10
-        aces -= 1
-    is_soft = aces > 0 and total == hand.value and hand.value <= 21
-
     # Soft totals decisions
     if is_soft:
-        if hand.value == 20:  # A,9
+        if value == 20:  # A,9
             return "stand"
-        if hand.value == 19:  # A,8
-            return "double" if dealer_val == 6 and hand.can_double() else "stand"
-        if hand.value == 18:
-            if 2 <= dealer_val <= 6 and hand.can_double():
+        if value == 19:  # A,8
+            return "double" if dealer_val == 6 and can_double else "stand"
+        if value == 18:
+            if 2 <= dealer_val <= 6 and can_double:
                 return "double"
             if 9 <= dealer_val <= 11:
                 return "hit"
             return "stand"
-        if hand.value == 17:
-            return "double" if 3 <= dealer_val <= 6 and hand.can_double() else "hit"
-        if hand.value in (15, 16):
-            return "double" if 4 <= dealer_val <= 6 and hand.can_double() else "hit"
-        if hand.value in (13, 14):
-            return "double" if 5 <= dealer_val <= 6 and hand.can_double() else "hit"
+        if value == 17:
+            return "double" if 3 <= dealer_val <= 6 and can_double else "hit"
+        if value in (15, 16):
+            return "double" if 4 <= dealer_val <= 6 and can_double else "hit"
+        if value in (13, 14):
+            return "double" if 5 <= dealer_val <= 6 and can_double else "hit"
 
     # Hard totals
-    if hand.value >= 17:
+    if value >= 17:
         return "stand"
-    if 13 <= hand.value <= 16:
+    if 13 <= value <= 16:
         return "stand" if dealer_val < 7 else "hit"
-    if hand.value == 12:
+    if value == 12:
         return "stand" if 4 <= dealer_val <= 6 else "hit"
-    if hand.value == 11:
-        return "double" if hand.can_double() else "hit"
-    if hand.value == 10:
-        return "double" if dealer_val <= 9 and hand.can_double() else "hit"
-    if hand.value == 9:
-        return "double" if 3 <= dealer_val <= 6 and hand.can_double() else "hit"
+    if value == 11:
+        return "double" if can_double else "hit"
+    if value == 10:
+        return "double" if dealer_val <= 9 and can_double else "hit"
+    if value == 9:
+        return "double" if 3 <= dealer_val <= 6 and can_double else "hit"
     return "hit"
 
 
+# The Basic Strategy decision is a pure function of a handful of hand
+# features, so it is evaluated once per combination at import time and
+# looked up afterwards.
+_BASIC_TABLE: Dict[Tuple[int, bool, str, bool, Optional[str]], str] = {
+    key: _basic_decision(*key)
+    for key in itertools.product(
+        range(2, 22), (False, True), RANKS, (False, True), (None, *RANKS)
+    )
+}
+
+
+def basic_strategy(hand: HandState, dealer_up: str) -> str:
+    """
+    Simplified Basic Strategy (see ``_basic_decision``), served from a
+    precomputed table.
+
+    :param hand: The player's current hand state.
+    :param dealer_up: Dealer's upcard rank.
+    :returns: One of 'hit', 'stand', 'double', or 'split'.
+    """
+    flags = hand.flags
+    key = (
+        hand.value,
+        hand.is_soft,
+        dealer_up,
+        bool(flags & CAN_DOUBLE),
+        hand.cards[0] if flags & PAIR else None,
+    )
+    action = _BASIC_TABLE.get(key)
+    if action is None:
+        action = _basic_decision(*key)
+    return action
+
+
 STRATEGIES: Dict[str, callable] = {
     "simplest": simplest_strategy,
     "random": random_strategy,
     "basic": basic_strategy,
-}
\ No newline at end of file
+}
+
+# Strategies whose decision is a pure function of the hand and upcard.  They
+# are simulated along the single path they actually play (see
+# ``game.simulate_rounds(single_path=...)``) instead of exploring every branch.
+DETERMINISTIC_STRATEGIES = frozenset({"simplest", "basic"})
\ No newline at end of file
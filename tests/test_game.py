@@ -0,0 +1,121 @@
+"""Tests for the single-path round simulation in ``game``."""
+
+import game
+from game import (
+    HILO_ARR,
+    MAX_HANDS,
+    RANK_CODES,
+    Shoe,
+    play_single_path,
+    simulate_rounds,
+)
+from strategies import STRATEGIES, basic_strategy, simplest_strategy
+
+
+def _stacked_shoe(ranks, reshuffle_when_empty=False):
+    """A one-deck shoe that deals ``ranks`` in order before anything else."""
+    shoe = Shoe(num_decks=1, shuffle_seed=0, reshuffle_when_empty=reshuffle_when_empty)
+    shoe._shoe = [RANK_CODES[r] for r in reversed(ranks)]
+    shoe._pos = len(ranks)
+    return shoe
+
+
+def _play(player, dealer, shoe, strategy_fn=basic_strategy, running_count_prev=0.0):
+    results = []
+    count = play_single_path(
+        init_player=[RANK_CODES[r] for r in player],
+        init_dealer=[RANK_CODES[r] for r in dealer],
+        shoe=shoe,
+        strategy_name="basic",
+        strategy_fn=strategy_fn,
+        base_bet=10.0,
+        round_id=1,
+        true_count_prev_round=0.0,
+        running_count_prev=running_count_prev,
+        bet_mode="fixed",
+        results_acc=results,
+    )
+    return results, count
+
+
+def test_split_at_max_hands_asks_strategy_again():
+    # Every split deals another 9, so the fourth 9-9 hand hits the cap and
+    # must be played as a hard 18 against a 2 (stand), not hit.
+    shoe = _stacked_shoe(["9"] * 6 + ["10"])
+    results, _ = _play(["9", "9"], ["2", "K"], shoe)
+
+    assert len(results) == MAX_HANDS
+    for r in results:
+        assert r.player_cards == ("9", "9")
+        assert r.actions[-1] == "stand"
+        assert "hit" not in r.actions
+
+
+def test_split_hands_are_never_blackjack():
+    shoe = _stacked_shoe(["K", "Q", "5"])
+    results, _ = _play(["A", "A"], ["6", "10"], shoe)
+
+    assert [r.player_cards for r in results] == [("A", "K"), ("A", "Q")]
+    assert not any(r.blackjack for r in results)
+
+
+def test_mid_round_reshuffle_counts_only_new_shoe():
+    # 10-6 against a 7 hits, which empties the stacked shoe and reshuffles.
+    shoe = _stacked_shoe([], reshuffle_when_empty=True)
+    results, count = _play(["10", "6"], ["10", "7"], shoe, running_count_prev=5.0)
+
+    (row,) = results
+    dealt = shoe.dealt_since_shuffle()
+    assert shoe.shuffles == 2
+    assert count == sum(HILO_ARR[c] for c in dealt)
+    assert row.running_count_end == count
+    assert row.cards_remaining == 52 - len(dealt)
+    assert row.true_count_end == round(count / (row.cards_remaining / 52.0), 3)
+
+
+def test_true_count_carries_over_a_mid_round_reshuffle(monkeypatch):
+    # The shoe built by simulate_rounds holds only the opening deal, so the
+    # first hit (10-6 against a 7) empties it and reshuffles mid-round.
+    shoes = []
+
+    class OpeningShoe(Shoe):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            stacked = _stacked_shoe(["10", "6", "10", "7"])
+            self._shoe, self._pos = stacked._shoe, stacked._pos
+            shoes.append(self)
+
+    monkeypatch.setattr(game, "Shoe", OpeningShoe)
+    rows = simulate_rounds(2, 1, 10.0, "basic", basic_strategy, seed=1, single_path=True)
+    first = rows[0]
+    second = next(r for r in rows if r.round_id == 2)
+
+    shoe = shoes[0]
+    assert shoe.shuffles == 2
+    assert first.round_id == 1 and first.actions[0] == "hit"
+    # Round 1 counts only the cards it drew from the new shoe.
+    assert first.running_count_end == sum(HILO_ARR[c] for c in shoe._shoe[first.cards_remaining:])
+    assert first.true_count_end == round(first.running_count_end / (first.cards_remaining / 52.0), 3)
+    assert second.true_count_prev_round == first.true_count_end
+
+
+def test_simplest_plays_one_row_per_round():
+    rows = simulate_rounds(500, 2, 10.0, "simplest", simplest_strategy, seed=1, single_path=True)
+
+    assert [r.round_id for r in rows] == list(range(1, 501))
+    assert all(r.hand_number == 1 and r.strategy_used == "simplest" for r in rows)
+
+
+def test_basic_rows_per_round_follow_splits():
+    rows = simulate_rounds(2000, 6, 10.0, "basic", STRATEGIES["basic"], seed=1, single_path=True)
+
+    by_round = {}
+    for r in rows:
+        by_round.setdefault(r.round_id, []).append(r)
+    assert sorted(by_round) == list(range(1, 2001))
+    for hands in by_round.values():
+        assert 1 <= len(hands) <= MAX_HANDS
+        assert [r.hand_number for r in hands] == list(range(1, len(hands) + 1))
+        if len(hands) > 1:
+            assert all(r.actions[0] == "split" for r in hands)
+    assert any(len(hands) > 1 for hands in by_round.values())
@@ -0,0 +1,113 @@
+"""Tests for the strategy functions in ``strategies``."""
+
+import itertools
+
+import pytest
+
+from game import RANKS, VALUES, HandState
+from strategies import basic_strategy
+
+
+def _original_basic_strategy(cards, dealer_up):
+    """
+    Frozen copy of the original if-chain ``basic_strategy``, working from
+    the raw cards only, so the table-driven version is checked against
+    rules that share none of its ``HandState`` caching or key building.
+    """
+    dealer_val = VALUES[dealer_up]
+    can_double = len(cards) == 2
+
+    if len(cards) == 2 and cards[0] == cards[1]:
+        rank = cards[0]
+        if rank == "A":
+            return "split"
+        if rank == "10":
+            return "stand"
+        if rank == "9":
+            return "split" if (2 <= dealer_val <= 9 and dealer_val != 7) else "stand"
+        if rank == "8":
+            return "split"
+        if rank == "7":
+            return "split" if 2 <= dealer_val <= 7 else "hit"
+        if rank == "6":
+            return "split" if 2 <= dealer_val <= 6 else "hit"
+        if rank == "5":
+            return "double" if (2 <= dealer_val <= 9 and can_double) else "hit"
+        if rank == "4":
+            return "split" if 5 <= dealer_val <= 6 else "hit"
+        if rank in ("3", "2"):
+            return "split" if 2 <= dealer_val <= 7 else "hit"
+
+    total = 0
+    aces = 0
+    for c in cards:
+        if c == "A":
+            total += 11
+            aces += 1
+        else:
+            total += VALUES[c]
+    while total > 21 and aces > 0:
+        total -= 10
+        aces -= 1
+    value = total
+    is_soft = aces > 0
+
+    if is_soft:
+        if value == 20:
+            return "stand"
+        if value == 19:
+            return "double" if dealer_val == 6 and can_double else "stand"
+        if value == 18:
+            if 2 <= dealer_val <= 6 and can_double:
+                return "double"
+            if 9 <= dealer_val <= 11:
+                return "hit"
+            return "stand"
+        if value == 17:
+            return "double" if 3 <= dealer_val <= 6 and can_double else "hit"
+        if value in (15, 16):
+            return "double" if 4 <= dealer_val <= 6 and can_double else "hit"
+        if value in (13, 14):
+            return "double" if 5 <= dealer_val <= 6 and can_double else "hit"
+
+    if value >= 17:
+        return "stand"
+    if 13 <= value <= 16:
+        return "stand" if dealer_val < 7 else "hit"
+    if value == 12:
+        return "stand" if 4 <= dealer_val <= 6 else "hit"
+    if value == 11:
+        return "double" if can_double else "hit"
+    if value == 10:
+        return "double" if dealer_val <= 9 and can_double else "hit"
+    if value == 9:
+        return "double" if 3 <= dealer_val <= 6 and can_double else "hit"
+    return "hit"
+
+
+@pytest.mark.parametrize("n_cards", [2, 3, 4])
+def test_basic_strategy_matches_original(n_cards):
+    for cards in itertools.product(RANKS, repeat=n_cards):
+        hand = HandState(cards=list(cards), bet=1.0, actions=[])
+        if hand.value > 21:
+            continue
+        for up in RANKS:
+            assert basic_strategy(hand, up) == _original_basic_strategy(cards, up), (cards, up)
+
+
+@pytest.mark.parametrize(
+    "cards, dealer_up, expected",
+    [
+        (["A", "7"], "9", "hit"),        # soft 18 vs 9
+        (["9", "9"], "7", "stand"),
+        (["5", "5"], "10", "hit"),
+        (["A", "2", "4"], "5", "hit"),   # soft 17, three cards: no double
+        (["A", "6"], "5", "double"),
+        (["A", "A"], "K", "split"),
+        (["J", "J"], "6", "stand"),
+        (["10", "6"], "7", "hit"),
+    ],
+)
+def test_basic_strategy_known_decisions(cards, dealer_up, expected):
+    hand = HandState(cards=cards, bet=1.0, actions=[])
+    assert basic_strategy(hand, dealer_up) == expected